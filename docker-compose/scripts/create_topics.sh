@@ -6,21 +6,43 @@ echo "Creating test topics for protobuf messages..."
 
 KAFKA_BROKERS=${KAFKA_BROKERS:-kafka:29092}
 
-# Wait for Kafka to be ready
+# Wait for Kafka to be ready - probe the broker with capped exponential backoff
+# instead of sleeping for a fixed time
 echo "Waiting for Kafka to be ready..."
-sleep 10
+max_attempts=30
+attempt=0
+until kafka-broker-api-versions --bootstrap-server $KAFKA_BROKERS > /dev/null 2>&1; do
+    attempt=$((attempt + 1))
+    if [ $attempt -ge $max_attempts ]; then
+        echo "Kafka is not reachable at $KAFKA_BROKERS after $max_attempts attempts"
+        exit 1
+    fi
+    delay=$((1 << (attempt - 1)))
+    if [ $delay -gt 5 ]; then
+        delay=5
+    fi
+    echo "   Kafka not ready yet (attempt $attempt/$max_attempts), retrying in ${delay}s..."
+    sleep $delay
+done
 
-# Create topics
+# Create topics - issue all create requests first, then wait for them together instead of
+# running one kafka-topics invocation after another
 echo "Creating topics..."
-kafka-topics --bootstrap-server $KAFKA_BROKERS --create --topic user-events --partitions 3 --replication-factor 1 --if-not-exists
-kafka-topics --bootstrap-server $KAFKA_BROKERS --create --topic order-events --partitions 3 --replication-factor 1 --if-not-exists
-kafka-topics --bootstrap-server $KAFKA_BROKERS --create --topic test-protobuf-data --partitions 1 --replication-factor 1 --if-not-exists
+pids=()
+kafka-topics --bootstrap-server $KAFKA_BROKERS --create --topic user-events --partitions 3 --replication-factor 1 --if-not-exists &
+pids+=($!)
+kafka-topics --bootstrap-server $KAFKA_BROKERS --create --topic order-events --partitions 3 --replication-factor 1 --if-not-exists &
+pids+=($!)
+kafka-topics --bootstrap-server $KAFKA_BROKERS --create --topic test-protobuf-data --partitions 1 --replication-factor 1 --if-not-exists &
+pids+=($!)
+for pid in "${pids[@]}"; do
+    wait $pid
+done
 
 echo "Topics created successfully!"
 echo "Available topics:"
 kafka-topics --bootstrap-server $KAFKA_BROKERS --list
 
+# Describe all test topics in a single request instead of one CLI round-trip per topic
 echo "Topic descriptions:"
-kafka-topics --bootstrap-server $KAFKA_BROKERS --describe --topic user-events
-kafka-topics --bootstrap-server $KAFKA_BROKERS --describe --topic order-events
-kafka-topics --bootstrap-server $KAFKA_BROKERS --describe --topic test-protobuf-data
\ No newline at end of file
+kafka-topics --bootstrap-server $KAFKA_BROKERS --describe --topic 'user-events|order-events|test-protobuf-data'
\ No newline at end of file
@@ -27,7 +27,11 @@ echo "Sending complete protobuf User message..."
 # Field 3 (email): string "abc@example.com" = 0x1A 0x0F "abc@example.com"
 # Field 5 (type): enum ADMIN = 1 = 0x28 0x01
 
-printf '\x08\xC8\x03\x12\x08John Doe\x1A\x0Fabc@example.com\x28\x01' | docker exec -i kafka-protobuf-test kafka-console-producer --bootstrap-server kafka:29092 --topic user-events
+# Records are lz4-compressed on the producer side; consumers (including kafbat UI) decompress
+# transparently, so the serde still sees the raw protobuf bytes.
+# acks=1: the leader's acknowledgement is enough for a single-broker test cluster, and callers
+# still get a delivery confirmation before the script returns
+printf '\x08\xC8\x03\x12\x08John Doe\x1A\x0Fabc@example.com\x28\x01' | docker exec -i kafka-protobuf-test kafka-console-producer --bootstrap-server kafka:29092 --topic user-events --compression-codec lz4 --request-required-acks 1
 
 echo "Complete protobuf User message sent with:"
 echo "  - id: 456"
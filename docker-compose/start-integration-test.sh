@@ -24,10 +24,7 @@ fi
 echo "🐳 Starting Docker Compose services..."
 docker-compose up -d
 
-echo "⏳ Waiting for services to be healthy..."
-sleep 10
-
-# Wait for services to be ready
+# Poll for health instead of sleeping for a fixed time up front
 echo "🔍 Checking service health..."
 while ! docker-compose ps | grep -q "healthy"; do
     echo "   Waiting for services to start..."
@@ -42,11 +39,11 @@ echo ""
 echo "📋 Next steps:"
 echo "1. Open http://localhost:8080 in your browser"
 echo "2. Check that 'ProtobufTestCluster' appears"
-echo "3. Optionally start message producer:"
-echo "   docker-compose --profile producer up -d producer"
+echo "3. Send more sample messages:"
+echo "   ./scripts/send_test_message.sh"
 echo ""
 echo "🔍 To view logs:"
-echo "   docker-compose logs -f [kafka-ui|kafka|producer]"
+echo "   docker-compose logs -f [kafka-ui|kafka]"
 echo ""
 echo "🛑 To stop:"
 echo "   docker-compose down"
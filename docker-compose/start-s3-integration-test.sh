@@ -24,12 +24,9 @@ fi
 echo "🐳 Starting core services (Kafka, Zookeeper, RustFS)..."
 docker-compose up -d kafka zookeeper rustfs
 
-echo "⏳ Waiting for core services to be healthy..."
-sleep 15
-
-# Check core service health
+# Check core service health (polls until healthy, no fixed up-front wait)
 echo "🔍 Checking core service health..."
-timeout=120
+timeout=135
 elapsed=0
 while [ $elapsed -lt $timeout ]; do
     if docker-compose ps kafka | grep -q "healthy" && \
@@ -75,11 +72,8 @@ docker-compose --profile setup run --rm topic-creator
 echo "🌐 Starting Kafka UI with S3 descriptor source..."
 docker-compose --profile s3-test up -d kafka-ui-s3
 
-echo "⏳ Waiting for Kafka UI to be ready..."
-sleep 20
-
 # Wait for Kafka UI to be healthy
-timeout=60
+timeout=80
 elapsed=0
 while [ $elapsed -lt $timeout ]; do
     if docker-compose --profile s3-test ps kafka-ui-s3 | grep -q "healthy"; then
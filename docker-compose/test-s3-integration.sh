@@ -96,9 +96,6 @@ test_message_processing() {
         return 1
     fi
     
-    # Wait a bit for message to be processed
-    sleep 3
-    
     echo -e "${GREEN}   ✅ Message processing test completed${NC}"
     return 0
 }
@@ -150,13 +147,15 @@ main() {
     # Wait for core services
     check_service "http://localhost:9000/health" "RustFS" || exit 1
 
-    # Setup RustFS with descriptor
-    echo -e "${BLUE}📁 Setting up RustFS with test descriptor...${NC}"
-    docker-compose --profile setup run --rm rustfs-setup
-    
-    # Create topics
-    echo -e "${BLUE}📋 Creating test topics...${NC}"
-    docker-compose --profile setup run --rm topic-creator
+    # Setup RustFS with descriptor and create topics concurrently - the two steps are
+    # independent, so only wait once for both (-T: no TTY for background runs)
+    echo -e "${BLUE}📁 Setting up RustFS with test descriptor and creating test topics...${NC}"
+    docker-compose --profile setup run --rm -T rustfs-setup &
+    rustfs_setup_pid=$!
+    docker-compose --profile setup run --rm -T topic-creator &
+    topic_creator_pid=$!
+    wait $rustfs_setup_pid
+    wait $topic_creator_pid
     
     # Start Kafka UI with S3
     echo -e "${BLUE}🌐 Starting Kafka UI with S3 configuration...${NC}"
@@ -2,8 +2,6 @@ package io.github.hursungyun.kafbat.ui.serde;
 
 import com.google.protobuf.DescriptorProtos;
 import com.google.protobuf.Descriptors;
-import io.github.hursungyun.kafbat.ui.serde.auth.MinioClientFactory;
-import io.github.hursungyun.kafbat.ui.serde.auth.S3Configuration;
 import io.github.hursungyun.kafbat.ui.serde.scheduler.DescriptorRefreshScheduler;
 import io.github.hursungyun.kafbat.ui.serde.serialization.ProtobufDeserializer;
 import io.github.hursungyun.kafbat.ui.serde.serialization.ProtobufSerializer;
@@ -15,9 +13,12 @@ import io.github.hursungyun.kafbat.ui.serde.util.MappingComparator;
 import io.kafbat.ui.serde.api.PropertyResolver;
 import io.kafbat.ui.serde.api.SchemaDescription;
 import io.kafbat.ui.serde.api.Serde;
-import io.minio.MinioClient;
 import java.io.IOException;
+import java.util.ArrayDeque;
+import java.util.ArrayList;
+import java.util.Deque;
 import java.util.HashMap;
+import java.util.List;
 import java.util.Map;
 import java.util.Optional;
 import org.slf4j.Logger;
@@ -28,11 +29,16 @@ public class ProtobufDescriptorSetSerde implements Serde {
     private static final Logger logger = LoggerFactory.getLogger(ProtobufDescriptorSetSerde.class);
 
     // Thread-safe fields accessed by both main thread and refresh thread
-    private volatile Map<String, Descriptors.FileDescriptor> fileDescriptorMap;
+    private volatile DescriptorProtos.FileDescriptorSet loadedDescriptorSet;
+    private volatile Map<String, Descriptors.Descriptor> messageDescriptorMap;
     private volatile Map<String, Descriptors.Descriptor> topicToMessageDescriptorMap =
             new HashMap<>();
     private volatile Descriptors.Descriptor defaultMessageDescriptor;
 
+    // Inputs the current topic mappings were built from, so unchanged refreshes can be skipped
+    private volatile Map<String, String> configuredTopicMappings;
+    private volatile Map<String, Descriptors.Descriptor> configuredMessageDescriptors;
+
     // Configuration fields (set once during configure())
     private DescriptorSource descriptorSource;
     private S3TopicMappingSource topicMappingSource;
@@ -72,7 +78,8 @@ public class ProtobufDescriptorSetSerde implements Serde {
 
     private void initializeDescriptorSources(PropertyResolver serdeProperties) {
         this.descriptorSource = DescriptorSourceFactory.create(serdeProperties);
-        this.topicMappingSource = createTopicMappingSource(serdeProperties);
+        this.topicMappingSource =
+                DescriptorSourceFactory.createTopicMappingSource(serdeProperties, descriptorSource);
     }
 
     private void initializeDescriptors()
@@ -91,73 +98,42 @@ public class ProtobufDescriptorSetSerde implements Serde {
         this.protobufDeserializer = new ProtobufDeserializer();
     }
 
-    private void loadDescriptorSet() throws IOException, Descriptors.DescriptorValidationException {
+    /**
+     * Loads the descriptor set from the configured source and rebuilds the descriptors if it
+     * changed.
+     *
+     * @return true if the descriptors were rebuilt, false if the source returned the set already
+     *     loaded
+     */
+    private boolean loadDescriptorSet()
+            throws IOException, Descriptors.DescriptorValidationException {
         DescriptorProtos.FileDescriptorSet descriptorSet = descriptorSource.loadDescriptorSet();
 
-        fileDescriptorMap = new HashMap<>();
-        Map<String, Descriptors.FileDescriptor> tempDescriptors = new HashMap<>();
-
-        // First pass: create all FileDescriptors without dependencies
-        for (DescriptorProtos.FileDescriptorProto fileDescriptorProto :
-                descriptorSet.getFileList()) {
-            if (fileDescriptorProto.getDependencyCount() == 0) {
-                Descriptors.FileDescriptor fileDescriptor =
-                        Descriptors.FileDescriptor.buildFrom(
-                                fileDescriptorProto, new Descriptors.FileDescriptor[0]);
-                tempDescriptors.put(fileDescriptorProto.getName(), fileDescriptor);
-            }
-        }
-
-        // Second pass: create FileDescriptors with dependencies
-        buildFileDescriptorsWithDependencies(descriptorSet, tempDescriptors);
-
-        this.fileDescriptorMap = tempDescriptors;
-    }
-
-    private S3TopicMappingSource createTopicMappingSource(PropertyResolver properties) {
-        // Check for S3 topic mapping configuration
-        Optional<String> s3Bucket =
-                properties.getProperty("topic.mapping.value.s3.bucket", String.class);
-        Optional<String> s3ObjectKey =
-                properties.getProperty("topic.mapping.value.s3.object.key", String.class);
-
-        if (s3Bucket.isPresent() && s3ObjectKey.isPresent()) {
-            // Use existing S3 configuration from descriptor source
-            if (descriptorSource instanceof S3DescriptorSource) {
-                // Reuse the MinIO client from descriptor source - this requires exposing the client
-                // For now, we'll create a new client with the same configuration
-                return createS3TopicMappingSourceFromProperties(
-                        properties, s3Bucket.get(), s3ObjectKey.get());
-            } else {
-                // Check if we have S3 credentials in properties
-                Optional<String> s3Endpoint = properties.getProperty("s3.endpoint", String.class);
-                if (s3Endpoint.isPresent()) {
-                    return createS3TopicMappingSourceFromProperties(
-                            properties, s3Bucket.get(), s3ObjectKey.get());
-                }
-            }
+        // Sources hand back their cached set when nothing changed - skip rebuilding descriptors
+        if (descriptorSet == loadedDescriptorSet) {
+            return false;
         }
 
-        return null;
-    }
-
-    private S3TopicMappingSource createS3TopicMappingSourceFromProperties(
-            PropertyResolver properties, String bucket, String objectKey) {
-        // Create S3 configuration from properties (reusing same S3 config as descriptors)
-        S3Configuration config = S3Configuration.fromProperties(properties, "descriptor.value.s3");
+        Map<String, Descriptors.FileDescriptor> newFileDescriptors =
+                buildFileDescriptors(descriptorSet);
 
-        // Create MinIO client using the factory
-        MinioClient minioClient = MinioClientFactory.create(config);
-
-        return new S3TopicMappingSource(
-                minioClient, bucket, objectKey, config.getRefreshInterval());
+        // Index message types once per descriptor build rather than on every mapping change
+        this.messageDescriptorMap = buildDescriptorMap(newFileDescriptors);
+        this.loadedDescriptorSet = descriptorSet;
+        return true;
     }
 
     private void configureTopicMappings(PropertyResolver serdeProperties) {
         Optional<String> defaultMessageName =
                 serdeProperties.getProperty("message.value.default.type", String.class);
         Map<String, String> combinedTopicMappings = loadCombinedTopicMappings(serdeProperties);
-        Map<String, Descriptors.Descriptor> allDescriptors = buildDescriptorMap();
+        Map<String, Descriptors.Descriptor> allDescriptors = messageDescriptorMap;
+
+        // Keep the already-built mappings if neither the mappings nor the descriptors changed
+        if (allDescriptors == configuredMessageDescriptors
+                && combinedTopicMappings.equals(configuredTopicMappings)) {
+            return;
+        }
 
         // Build new state without mutating existing state (thread-safe)
         Descriptors.Descriptor newDefaultDescriptor =
@@ -168,6 +144,8 @@ public class ProtobufDescriptorSetSerde implements Serde {
         // Atomic assignment - volatile writes ensure visibility to other threads
         this.defaultMessageDescriptor = newDefaultDescriptor;
         this.topicToMessageDescriptorMap = newTopicMappings;
+        this.configuredTopicMappings = combinedTopicMappings;
+        this.configuredMessageDescriptors = allDescriptors;
     }
 
     private Map<String, String> loadCombinedTopicMappings(PropertyResolver serdeProperties) {
@@ -197,9 +175,10 @@ public class ProtobufDescriptorSetSerde implements Serde {
         return combinedTopicMappings;
     }
 
-    private Map<String, Descriptors.Descriptor> buildDescriptorMap() {
+    private Map<String, Descriptors.Descriptor> buildDescriptorMap(
+            Map<String, Descriptors.FileDescriptor> fileDescriptors) {
         Map<String, Descriptors.Descriptor> allDescriptors = new HashMap<>();
-        for (Descriptors.FileDescriptor fileDescriptor : fileDescriptorMap.values()) {
+        for (Descriptors.FileDescriptor fileDescriptor : fileDescriptors.values()) {
             for (Descriptors.Descriptor messageDescriptor : fileDescriptor.getMessageTypes()) {
                 allDescriptors.put(messageDescriptor.getFullName(), messageDescriptor);
             }
@@ -416,11 +395,16 @@ public class ProtobufDescriptorSetSerde implements Serde {
                 }
 
                 // Reload descriptors - this will use graceful error handling in S3DescriptorSource
-                loadDescriptorSet();
+                boolean changed = loadDescriptorSet();
                 refreshed = true;
-                logger.info(
-                        "Successfully refreshed descriptor set from: {}",
-                        descriptorSource.getDescription());
+                if (changed) {
+                    logger.info(
+                            "Successfully refreshed descriptor set from: {}",
+                            descriptorSource.getDescription());
+                } else {
+                    logger.debug(
+                            "Descriptor set unchanged from: {}", descriptorSource.getDescription());
+                }
             } catch (Exception e) {
                 // Log warning but don't break existing functionality
                 logger.warn(
@@ -524,46 +508,56 @@ public class ProtobufDescriptorSetSerde implements Serde {
         return null;
     }
 
-    private void buildFileDescriptorsWithDependencies(
-            DescriptorProtos.FileDescriptorSet descriptorSet,
-            Map<String, Descriptors.FileDescriptor> tempDescriptors)
+    /**
+     * Build FileDescriptors in dependency order using a topological sort (Kahn's algorithm), so
+     * each file is linked exactly once regardless of its position in the descriptor set. Files
+     * whose dependencies are not present in the set are skipped.
+     */
+    private Map<String, Descriptors.FileDescriptor> buildFileDescriptors(
+            DescriptorProtos.FileDescriptorSet descriptorSet)
             throws Descriptors.DescriptorValidationException {
-        boolean progress = true;
-        while (progress && tempDescriptors.size() < descriptorSet.getFileCount()) {
-            progress = false;
-            for (DescriptorProtos.FileDescriptorProto fileDescriptorProto :
-                    descriptorSet.getFileList()) {
-                if (tempDescriptors.containsKey(fileDescriptorProto.getName())) {
-                    continue;
-                }
-
-                Descriptors.FileDescriptor[] dependencies =
-                        resolveDependencies(fileDescriptorProto, tempDescriptors);
-                if (dependencies != null) {
-                    Descriptors.FileDescriptor fileDescriptor =
-                            Descriptors.FileDescriptor.buildFrom(fileDescriptorProto, dependencies);
-                    tempDescriptors.put(fileDescriptorProto.getName(), fileDescriptor);
-                    progress = true;
-                }
+        List<DescriptorProtos.FileDescriptorProto> files = descriptorSet.getFileList();
+        Map<String, Descriptors.FileDescriptor> builtDescriptors = new HashMap<>();
+
+        // Count unresolved dependencies per file and index which files depend on each name
+        int[] pendingDependencies = new int[files.size()];
+        Map<String, List<Integer>> dependents = new HashMap<>();
+        Deque<Integer> ready = new ArrayDeque<>();
+        for (int i = 0; i < files.size(); i++) {
+            DescriptorProtos.FileDescriptorProto fileDescriptorProto = files.get(i);
+            pendingDependencies[i] = fileDescriptorProto.getDependencyCount();
+            for (String dependency : fileDescriptorProto.getDependencyList()) {
+                dependents.computeIfAbsent(dependency, name -> new ArrayList<>()).add(i);
+            }
+            if (pendingDependencies[i] == 0) {
+                ready.add(i);
             }
         }
-    }
 
-    private Descriptors.FileDescriptor[] resolveDependencies(
-            DescriptorProtos.FileDescriptorProto fileDescriptorProto,
-            Map<String, Descriptors.FileDescriptor> tempDescriptors) {
-        Descriptors.FileDescriptor[] dependencies =
-                new Descriptors.FileDescriptor[fileDescriptorProto.getDependencyCount()];
-
-        for (int i = 0; i < fileDescriptorProto.getDependencyCount(); i++) {
-            String depName = fileDescriptorProto.getDependency(i);
-            Descriptors.FileDescriptor dependency = tempDescriptors.get(depName);
-            if (dependency == null) {
-                return null; // Not all dependencies resolved yet
+        while (!ready.isEmpty()) {
+            DescriptorProtos.FileDescriptorProto fileDescriptorProto = files.get(ready.poll());
+            String fileName = fileDescriptorProto.getName();
+            if (builtDescriptors.containsKey(fileName)) {
+                continue; // Duplicate file name in the set - keep the first one
+            }
+
+            Descriptors.FileDescriptor[] dependencies =
+                    new Descriptors.FileDescriptor[fileDescriptorProto.getDependencyCount()];
+            for (int i = 0; i < dependencies.length; i++) {
+                dependencies[i] = builtDescriptors.get(fileDescriptorProto.getDependency(i));
+            }
+            builtDescriptors.put(
+                    fileName,
+                    Descriptors.FileDescriptor.buildFrom(fileDescriptorProto, dependencies));
+
+            // Release files that were only waiting on this one
+            for (int dependent : dependents.getOrDefault(fileName, List.of())) {
+                if (--pendingDependencies[dependent] == 0) {
+                    ready.add(dependent);
+                }
             }
-            dependencies[i] = dependency;
         }
 
-        return dependencies;
+        return builtDescriptors;
     }
 }
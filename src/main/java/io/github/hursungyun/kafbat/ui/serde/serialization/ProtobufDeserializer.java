@@ -4,7 +4,7 @@ import com.google.protobuf.Descriptors;
 import com.google.protobuf.DynamicMessage;
 import io.confluent.kafka.schemaregistry.protobuf.ProtobufSchemaUtils;
 import io.kafbat.ui.serde.api.DeserializeResult;
-import java.io.ByteArrayInputStream;
+import java.nio.charset.StandardCharsets;
 import java.util.HashMap;
 import java.util.Map;
 
@@ -14,13 +14,15 @@ public class ProtobufDeserializer {
     /**
      * Deserialize protobuf byte array to JSON using the specified descriptor Uses
      * ProtobufSchemaUtils.toJson for protobuf → JSON conversion
+     *
+     * <p>The record bytes are parsed in place rather than through an InputStream, which would copy
+     * them into a separate read buffer first.
      */
     public DeserializeResult deserialize(Descriptors.Descriptor messageDescriptor, byte[] bytes)
             throws Exception {
-        DynamicMessage message =
-                DynamicMessage.parseFrom(messageDescriptor, new ByteArrayInputStream(bytes));
+        DynamicMessage message = DynamicMessage.parseFrom(messageDescriptor, bytes);
         byte[] jsonFromProto = ProtobufSchemaUtils.toJson(message);
-        String jsonString = new String(jsonFromProto);
+        String jsonString = new String(jsonFromProto, StandardCharsets.UTF_8);
 
         Map<String, Object> metadata = new HashMap<>();
         metadata.put("messageType", messageDescriptor.getFullName());
@@ -5,7 +5,9 @@ import com.fasterxml.jackson.databind.ObjectMapper;
 import com.google.protobuf.Descriptors;
 import com.google.protobuf.DynamicMessage;
 import java.util.ArrayList;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Set;
 import java.util.stream.Collectors;
 
 /**
@@ -38,11 +40,7 @@ import java.util.stream.Collectors;
  */
 public class ProtobufMessageValidator {
 
-    private final ObjectMapper objectMapper;
-
-    public ProtobufMessageValidator() {
-        this.objectMapper = new ObjectMapper();
-    }
+    private static final ObjectMapper OBJECT_MAPPER = new ObjectMapper();
 
     /**
      * Validate a DynamicMessage for oneOf fields only
@@ -122,7 +120,7 @@ public class ProtobufMessageValidator {
      */
     public void validateJsonKeysForProto3(
             String jsonInput, Descriptors.Descriptor messageDescriptor) throws Exception {
-        JsonNode jsonNode = objectMapper.readTree(jsonInput);
+        JsonNode jsonNode = OBJECT_MAPPER.readTree(jsonInput);
 
         // Check for explicitly provided keys with null values
         for (Descriptors.FieldDescriptor field : messageDescriptor.getFields()) {
@@ -155,7 +153,7 @@ public class ProtobufMessageValidator {
             return;
         }
 
-        JsonNode jsonNode = objectMapper.readTree(jsonInput);
+        JsonNode jsonNode = OBJECT_MAPPER.readTree(jsonInput);
         List<String> missingKeys = new ArrayList<>();
 
         for (String requiredFieldName : requiredFields) {
@@ -188,7 +186,7 @@ public class ProtobufMessageValidator {
     public void validateFieldsPresent(
             String jsonInput, Descriptors.Descriptor messageDescriptor, String... fieldNames)
             throws Exception {
-        JsonNode jsonNode = objectMapper.readTree(jsonInput);
+        JsonNode jsonNode = OBJECT_MAPPER.readTree(jsonInput);
         List<String> missingKeys = new ArrayList<>();
 
         for (String fieldName : fieldNames) {
@@ -278,12 +276,12 @@ public class ProtobufMessageValidator {
      */
     public void validateAllFieldsPresent(String jsonInput, Descriptors.Descriptor messageDescriptor)
             throws Exception {
-        JsonNode jsonNode = objectMapper.readTree(jsonInput);
+        JsonNode jsonNode = OBJECT_MAPPER.readTree(jsonInput);
         List<String> missingFields = new ArrayList<>();
 
         // Build a set of fields that are part of a oneOf and should be skipped if another variant
-        // is present
-        List<Descriptors.FieldDescriptor> fieldsToSkip = new ArrayList<>();
+        // is present (hash set so the per-field check below stays constant time)
+        Set<Descriptors.FieldDescriptor> fieldsToSkip = new HashSet<>();
 
         // Check each oneOf - if at least one variant is present, skip validation for other variants
         for (Descriptors.OneofDescriptor oneOf : messageDescriptor.getOneofs()) {
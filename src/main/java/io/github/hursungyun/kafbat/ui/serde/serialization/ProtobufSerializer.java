@@ -36,6 +36,8 @@ public class ProtobufSerializer {
         }
 
         // Step 2: Parse JSON input into DynamicMessage using JsonFormat.Parser
+        // build() already rejects missing proto2 required fields (recursively), so no separate
+        // required-field pass is needed afterwards
         DynamicMessage.Builder messageBuilder = DynamicMessage.newBuilder(messageDescriptor);
         jsonParser.merge(jsonInput, messageBuilder);
         DynamicMessage message = messageBuilder.build();
@@ -43,9 +45,6 @@ public class ProtobufSerializer {
         // Step 3: Validate oneOf fields (always, even in lenient mode)
         validator.validateOneOfFields(message);
 
-        // Step 4: Always validate required fields (proto2 only)
-        validator.validateRequiredFields(message, messageDescriptor);
-
         // Convert to byte array
         return message.toByteArray();
     }
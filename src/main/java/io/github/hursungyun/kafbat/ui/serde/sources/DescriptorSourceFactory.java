@@ -34,6 +34,40 @@ public class DescriptorSourceFactory {
                         + " provided");
     }
 
+    /**
+     * Create the S3 topic mapping source if one is configured. When descriptors are also loaded
+     * from S3, the descriptor source's MinIO client is shared instead of building a second one.
+     *
+     * @param properties Serde properties
+     * @param descriptorSource The already created descriptor source
+     * @return The topic mapping source, or null if S3 topic mappings are not configured
+     */
+    public static S3TopicMappingSource createTopicMappingSource(
+            PropertyResolver properties, DescriptorSource descriptorSource) {
+        Optional<String> s3Bucket =
+                properties.getProperty("topic.mapping.value.s3.bucket", String.class);
+        Optional<String> s3ObjectKey =
+                properties.getProperty("topic.mapping.value.s3.object.key", String.class);
+        if (s3Bucket.isEmpty() || s3ObjectKey.isEmpty()) {
+            return null;
+        }
+
+        boolean s3Descriptors = descriptorSource instanceof S3DescriptorSource;
+        if (!s3Descriptors && properties.getProperty("s3.endpoint", String.class).isEmpty()) {
+            return null;
+        }
+
+        // Reuse the same S3 configuration as descriptors
+        S3Configuration config = S3Configuration.fromProperties(properties, "descriptor.value.s3");
+        MinioClient minioClient =
+                s3Descriptors
+                        ? ((S3DescriptorSource) descriptorSource).getMinioClient()
+                        : MinioClientFactory.create(config);
+
+        return new S3TopicMappingSource(
+                minioClient, s3Bucket.get(), s3ObjectKey.get(), config.getRefreshInterval());
+    }
+
     private static DescriptorSource createS3Source(
             PropertyResolver properties, String endpoint, String bucket, String objectKey) {
         // Create S3 configuration from properties
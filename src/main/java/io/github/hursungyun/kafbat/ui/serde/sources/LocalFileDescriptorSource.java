@@ -6,7 +6,10 @@ import java.io.IOException;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.nio.file.attribute.BasicFileAttributes;
+import java.nio.file.attribute.FileTime;
 import java.time.Instant;
+import java.util.Objects;
 import java.util.Optional;
 
 /** Descriptor source that loads from a local file */
@@ -14,6 +17,12 @@ public class LocalFileDescriptorSource implements DescriptorSource {
 
     private final String filePath;
 
+    // Caching - keyed on the file's identity (inode where available), modification time and size
+    private DescriptorProtos.FileDescriptorSet cachedDescriptorSet;
+    private Object cachedFileKey;
+    private FileTime cachedLastModified;
+    private long cachedSize;
+
     public LocalFileDescriptorSource(String filePath) {
         if (filePath == null || filePath.trim().isEmpty()) {
             throw new IllegalArgumentException("filePath cannot be null or empty");
@@ -22,10 +31,25 @@ public class LocalFileDescriptorSource implements DescriptorSource {
     }
 
     @Override
-    public DescriptorProtos.FileDescriptorSet loadDescriptorSet() throws IOException {
+    public synchronized DescriptorProtos.FileDescriptorSet loadDescriptorSet() throws IOException {
+        BasicFileAttributes attributes =
+                Files.readAttributes(Paths.get(filePath), BasicFileAttributes.class);
+
+        // Return the cached set if the file hasn't changed since it was parsed
+        if (cachedDescriptorSet != null
+                && Objects.equals(attributes.fileKey(), cachedFileKey)
+                && attributes.lastModifiedTime().equals(cachedLastModified)
+                && attributes.size() == cachedSize) {
+            return cachedDescriptorSet;
+        }
+
         try (FileInputStream fis = new FileInputStream(filePath)) {
-            return DescriptorProtos.FileDescriptorSet.parseFrom(fis);
+            cachedDescriptorSet = DescriptorProtos.FileDescriptorSet.parseFrom(fis);
         }
+        cachedFileKey = attributes.fileKey();
+        cachedLastModified = attributes.lastModifiedTime();
+        cachedSize = attributes.size();
+        return cachedDescriptorSet;
     }
 
     @Override
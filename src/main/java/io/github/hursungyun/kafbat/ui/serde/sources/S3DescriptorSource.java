@@ -35,7 +35,8 @@ public class S3DescriptorSource implements DescriptorSource {
     // Caching
     private final ReentrantReadWriteLock lock = new ReentrantReadWriteLock();
     private volatile DescriptorProtos.FileDescriptorSet cachedDescriptorSet;
-    private volatile Instant lastRefresh;
+    private volatile long lastRefreshNanos;
+    private volatile boolean refreshedOnce;
     private volatile String lastETag;
 
     public S3DescriptorSource(
@@ -88,7 +89,8 @@ public class S3DescriptorSource implements DescriptorSource {
 
             if (cachedDescriptorSet != null && currentETag.equals(lastETag)) {
                 // Object hasn't changed, just update refresh time
-                lastRefresh = Instant.now();
+                lastRefreshNanos = System.nanoTime();
+                refreshedOnce = true;
                 return cachedDescriptorSet;
             }
 
@@ -103,7 +105,8 @@ public class S3DescriptorSource implements DescriptorSource {
 
             // Atomic update - only update cache if parsing succeeded
             cachedDescriptorSet = newDescriptorSet;
-            lastRefresh = Instant.now();
+            lastRefreshNanos = System.nanoTime();
+            refreshedOnce = true;
             lastETag = currentETag;
 
             logger.debug(
@@ -165,20 +168,30 @@ public class S3DescriptorSource implements DescriptorSource {
         return true;
     }
 
-    /** Force refresh of the cached descriptor set on next load */
+    /**
+     * Get the MinIO client used by this source so other S3 sources can share its connections
+     *
+     * @return The underlying MinIO client
+     */
+    public MinioClient getMinioClient() {
+        return minioClient;
+    }
+
+    /**
+     * Force the next load to check S3 for changes. The last ETag is kept, so the object is only
+     * downloaded and parsed again if it actually changed.
+     */
     public void invalidateCache() {
         lock.writeLock().lock();
         try {
-            lastRefresh = null;
-            lastETag = null;
+            refreshedOnce = false;
         } finally {
             lock.writeLock().unlock();
         }
     }
 
     private boolean shouldRefresh() {
-        return lastRefresh == null
-                || Duration.between(lastRefresh, Instant.now()).compareTo(refreshInterval) >= 0;
+        return !refreshedOnce || System.nanoTime() - lastRefreshNanos >= refreshInterval.toNanos();
     }
 
     private StatObjectResponse getObjectStat() throws IOException {
@@ -25,16 +25,20 @@ import java.util.concurrent.locks.ReentrantReadWriteLock;
 /** Source for loading topic-to-message-type mappings from S3 JSON files */
 public class S3TopicMappingSource {
 
+    private static final ObjectMapper OBJECT_MAPPER = new ObjectMapper();
+    private static final TypeReference<Map<String, String>> TOPIC_MAPPINGS_TYPE =
+            new TypeReference<Map<String, String>>() {};
+
     private final MinioClient minioClient;
     private final String bucketName;
     private final String objectKey;
     private final Duration refreshInterval;
-    private final ObjectMapper objectMapper;
 
     // Caching
     private final ReentrantReadWriteLock lock = new ReentrantReadWriteLock();
     private volatile Map<String, String> cachedTopicMappings;
-    private volatile Instant lastRefresh;
+    private volatile long lastRefreshNanos;
+    private volatile boolean refreshedOnce;
     private volatile String lastETag;
 
     public S3TopicMappingSource(
@@ -59,7 +63,6 @@ public class S3TopicMappingSource {
         this.bucketName = bucketName.trim();
         this.objectKey = objectKey.trim();
         this.refreshInterval = refreshInterval;
-        this.objectMapper = new ObjectMapper();
     }
 
     public Map<String, String> loadTopicMappings() throws IOException {
@@ -87,7 +90,8 @@ public class S3TopicMappingSource {
 
             if (cachedTopicMappings != null && currentETag.equals(lastETag)) {
                 // Object hasn't changed, just update refresh time
-                lastRefresh = Instant.now();
+                lastRefreshNanos = System.nanoTime();
+                refreshedOnce = true;
                 return cachedTopicMappings;
             }
 
@@ -97,10 +101,9 @@ public class S3TopicMappingSource {
                             GetObjectArgs.builder().bucket(bucketName).object(objectKey).build())) {
 
                 // Parse JSON as Map<String, String>
-                TypeReference<Map<String, String>> typeRef =
-                        new TypeReference<Map<String, String>>() {};
-                cachedTopicMappings = objectMapper.readValue(inputStream, typeRef);
-                lastRefresh = Instant.now();
+                cachedTopicMappings = OBJECT_MAPPER.readValue(inputStream, TOPIC_MAPPINGS_TYPE);
+                lastRefreshNanos = System.nanoTime();
+                refreshedOnce = true;
                 lastETag = currentETag;
 
                 return cachedTopicMappings;
@@ -132,20 +135,21 @@ public class S3TopicMappingSource {
         return true;
     }
 
-    /** Force refresh of the cached topic mappings on next load */
+    /**
+     * Force the next load to check S3 for changes. The last ETag is kept, so the object is only
+     * downloaded and parsed again if it actually changed.
+     */
     public void invalidateCache() {
         lock.writeLock().lock();
         try {
-            lastRefresh = null;
-            lastETag = null;
+            refreshedOnce = false;
         } finally {
             lock.writeLock().unlock();
         }
     }
 
     private boolean shouldRefresh() {
-        return lastRefresh == null
-                || Duration.between(lastRefresh, Instant.now()).compareTo(refreshInterval) >= 0;
+        return !refreshedOnce || System.nanoTime() - lastRefreshNanos >= refreshInterval.toNanos();
     }
 
     private StatObjectResponse getObjectStat() throws IOException {
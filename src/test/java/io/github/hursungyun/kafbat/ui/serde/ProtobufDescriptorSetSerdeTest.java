@@ -16,6 +16,9 @@ import java.io.IOException;
 import java.io.InputStream;
 import java.nio.file.Files;
 import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
 import java.util.Map;
 import java.util.Optional;
 import org.junit.jupiter.api.BeforeEach;
@@ -296,6 +299,44 @@ class ProtobufDescriptorSetSerdeTest {
                 .hasMessageContaining("Failed to load protobuf descriptor set from");
     }
 
+    @Test
+    void shouldResolveDependenciesWhenFilesAreOutOfOrder() throws Exception {
+        // Reverse the descriptor set so every file appears before the files it imports
+        DescriptorProtos.FileDescriptorSet descriptorSet;
+        try (InputStream is = getClass().getResourceAsStream("/test_descriptors.desc")) {
+            descriptorSet = DescriptorProtos.FileDescriptorSet.parseFrom(is);
+        }
+        List<DescriptorProtos.FileDescriptorProto> reversedFiles =
+                new ArrayList<>(descriptorSet.getFileList());
+        Collections.reverse(reversedFiles);
+        Path descriptorFile = tempDir.resolve("reversed_descriptors.desc");
+        Files.write(
+                descriptorFile,
+                DescriptorProtos.FileDescriptorSet.newBuilder()
+                        .addAllFile(reversedFiles)
+                        .build()
+                        .toByteArray());
+
+        when(serdeProperties.getProperty("descriptor.value.file", String.class))
+                .thenReturn(Optional.of(descriptorFile.toString()));
+        mockS3PropertiesEmpty();
+        when(serdeProperties.getProperty("message.value.default.type", String.class))
+                .thenReturn(Optional.of("test.Order"));
+        when(serdeProperties.getMapProperty(
+                        "topic.mapping.value.local", String.class, String.class))
+                .thenReturn(Optional.empty());
+
+        serde.configure(serdeProperties, clusterProperties, appProperties);
+
+        DeserializeResult result =
+                serde.deserializer("order-topic", Serde.Target.VALUE)
+                        .deserialize(null, createOrderMessage());
+
+        assertThat(result.getAdditionalProperties()).containsEntry("messageType", "test.Order");
+        JsonNode jsonNode = objectMapper.readTree(result.getResult());
+        assertThat(jsonNode.get("user").get("name").asText()).isEqualTo("Jane Smith");
+    }
+
     private void mockS3PropertiesEmpty() {
         when(serdeProperties.getProperty("s3.endpoint", String.class)).thenReturn(Optional.empty());
         when(serdeProperties.getProperty("descriptor.value.s3.bucket", String.class))
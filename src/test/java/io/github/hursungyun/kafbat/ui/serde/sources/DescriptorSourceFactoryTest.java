@@ -147,4 +147,44 @@ class DescriptorSourceFactoryTest {
         assertThat(source).isInstanceOf(S3DescriptorSource.class);
         assertThat(source.supportsRefresh()).isTrue();
     }
+
+    @Test
+    void shouldNotCreateTopicMappingSourceWhenNotConfigured() {
+        when(properties.getProperty("topic.mapping.value.s3.bucket", String.class))
+                .thenReturn(Optional.empty());
+        when(properties.getProperty("topic.mapping.value.s3.object.key", String.class))
+                .thenReturn(Optional.empty());
+
+        S3TopicMappingSource source =
+                DescriptorSourceFactory.createTopicMappingSource(
+                        properties, new LocalFileDescriptorSource("/path/to/descriptors.desc"));
+
+        assertThat(source).isNull();
+    }
+
+    @Test
+    void shouldCreateTopicMappingSourceAlongsideS3DescriptorSource() {
+        when(properties.getProperty("s3.endpoint", String.class))
+                .thenReturn(Optional.of("http://localhost:9000"));
+        when(properties.getProperty("descriptor.value.s3.bucket", String.class))
+                .thenReturn(Optional.of("test-bucket"));
+        when(properties.getProperty("descriptor.value.s3.object.key", String.class))
+                .thenReturn(Optional.of("descriptors.desc"));
+        when(properties.getProperty("topic.mapping.value.s3.bucket", String.class))
+                .thenReturn(Optional.of("test-bucket"));
+        when(properties.getProperty("topic.mapping.value.s3.object.key", String.class))
+                .thenReturn(Optional.of("topic-mappings.json"));
+        when(properties.getProperty("s3.auth.access.key", String.class))
+                .thenReturn(Optional.of("access-key"));
+        when(properties.getProperty("s3.auth.secret.key", String.class))
+                .thenReturn(Optional.of("secret-key"));
+
+        DescriptorSource descriptorSource = DescriptorSourceFactory.create(properties);
+        S3TopicMappingSource source =
+                DescriptorSourceFactory.createTopicMappingSource(properties, descriptorSource);
+
+        assertThat(source).isNotNull();
+        assertThat(source.getDescription())
+                .isEqualTo("S3 Topic Mappings: s3://test-bucket/topic-mappings.json");
+    }
 }
@@ -0,0 +1,99 @@
+package io.github.hursungyun.kafbat.ui.serde.sources;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+import static org.junit.jupiter.api.Assumptions.assumeTrue;
+
+import com.google.protobuf.DescriptorProtos;
+import java.io.IOException;
+import java.io.InputStream;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
+import java.nio.file.attribute.BasicFileAttributes;
+import java.nio.file.attribute.FileTime;
+import java.time.Instant;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+class LocalFileDescriptorSourceTest {
+
+    @TempDir Path tempDir;
+
+    @Test
+    void shouldLoadDescriptorSetFromFile() throws Exception {
+        Path descriptorFile = copyDescriptorSetToTemp();
+        LocalFileDescriptorSource source = new LocalFileDescriptorSource(descriptorFile.toString());
+
+        DescriptorProtos.FileDescriptorSet descriptorSet = source.loadDescriptorSet();
+
+        assertThat(descriptorSet.getFileCount()).isGreaterThan(0);
+    }
+
+    @Test
+    void shouldReturnCachedDescriptorSetWhenFileUnchanged() throws Exception {
+        Path descriptorFile = copyDescriptorSetToTemp();
+        LocalFileDescriptorSource source = new LocalFileDescriptorSource(descriptorFile.toString());
+
+        DescriptorProtos.FileDescriptorSet first = source.loadDescriptorSet();
+        DescriptorProtos.FileDescriptorSet second = source.loadDescriptorSet();
+
+        // Same instance - the file was not parsed again
+        assertThat(second).isSameAs(first);
+    }
+
+    @Test
+    void shouldReloadDescriptorSetWhenFileModified() throws Exception {
+        Path descriptorFile = copyDescriptorSetToTemp();
+        LocalFileDescriptorSource source = new LocalFileDescriptorSource(descriptorFile.toString());
+
+        DescriptorProtos.FileDescriptorSet first = source.loadDescriptorSet();
+
+        // Bump the modification time to simulate the file being replaced
+        Files.setLastModifiedTime(descriptorFile, FileTime.from(Instant.now().plusSeconds(60)));
+
+        DescriptorProtos.FileDescriptorSet second = source.loadDescriptorSet();
+
+        assertThat(second).isNotSameAs(first);
+        assertThat(second).isEqualTo(first);
+    }
+
+    @Test
+    void shouldReloadDescriptorSetWhenFileReplacedWithSameTimestampAndSize() throws Exception {
+        Path descriptorFile = copyDescriptorSetToTemp();
+        assumeTrue(
+                Files.readAttributes(descriptorFile, BasicFileAttributes.class).fileKey() != null);
+        LocalFileDescriptorSource source = new LocalFileDescriptorSource(descriptorFile.toString());
+
+        DescriptorProtos.FileDescriptorSet first = source.loadDescriptorSet();
+
+        // Swap in a new file with identical size and mtime, as `cp -p` or `rsync -t` would
+        FileTime lastModified = Files.getLastModifiedTime(descriptorFile);
+        Path replacement = tempDir.resolve("replacement.desc");
+        Files.copy(descriptorFile, replacement);
+        Files.setLastModifiedTime(replacement, lastModified);
+        Files.move(replacement, descriptorFile, StandardCopyOption.REPLACE_EXISTING);
+
+        DescriptorProtos.FileDescriptorSet second = source.loadDescriptorSet();
+
+        assertThat(second).isNotSameAs(first);
+        assertThat(second).isEqualTo(first);
+    }
+
+    @Test
+    void shouldThrowExceptionWhenFileNotFound() {
+        LocalFileDescriptorSource source =
+                new LocalFileDescriptorSource(tempDir.resolve("missing.desc").toString());
+
+        assertThatThrownBy(source::loadDescriptorSet).isInstanceOf(IOException.class);
+    }
+
+    private Path copyDescriptorSetToTemp() throws IOException {
+        try (InputStream is = getClass().getResourceAsStream("/test_descriptors.desc")) {
+            assertThat(is).isNotNull();
+            Path descriptorFile = tempDir.resolve("test_descriptors.desc");
+            Files.copy(is, descriptorFile);
+            return descriptorFile;
+        }
+    }
+}
@@ -108,6 +108,20 @@ class S3DescriptorSourceTest {
         assertThat(refreshed).isNotNull();
     }
 
+    @Test
+    void shouldReuseCachedDescriptorSetWhenObjectUnchangedAfterInvalidation() throws Exception {
+        S3DescriptorSource source =
+                new S3DescriptorSource(minioClient, BUCKET_NAME, OBJECT_KEY, Duration.ofMinutes(5));
+
+        DescriptorProtos.FileDescriptorSet first = source.loadDescriptorSet();
+
+        // Invalidation forces an S3 check, but the ETag is unchanged so nothing is re-downloaded
+        source.invalidateCache();
+        DescriptorProtos.FileDescriptorSet second = source.loadDescriptorSet();
+
+        assertThat(second).isSameAs(first);
+    }
+
     @Test
     void shouldGetLastModified() throws Exception {
         S3DescriptorSource source =
@@ -137,6 +151,14 @@ class S3DescriptorSourceTest {
         assertThat(source.supportsRefresh()).isTrue();
     }
 
+    @Test
+    void shouldExposeMinioClientForSharing() {
+        S3DescriptorSource source =
+                new S3DescriptorSource(minioClient, BUCKET_NAME, OBJECT_KEY, Duration.ofMinutes(5));
+
+        assertThat(source.getMinioClient()).isSameAs(minioClient);
+    }
+
     @Test
     void shouldThrowExceptionForNonexistentObject() {
         S3DescriptorSource source =